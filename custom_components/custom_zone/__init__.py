@@ -1,17 +1,37 @@
 """The Custom Zone integration."""
 from __future__ import annotations
 
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HassJobType,
+    HomeAssistant,
+    callback,
+    is_callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
+
+from ._geometry import PreparedPolygon, parse_polygon_coords, prepare_polygon
+from .const import CONF_COORDINATES, CONF_NAME, DATA_TRACKER_LISTENERS, DOMAIN, MIN_POLYGON_POINTS
 
-from .const import DOMAIN
+_LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[str] = ["sensor"]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Custom Zone from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    # Validating the points and building the polygon's lookup structures is CPU work, so it
+    # runs in the executor rather than on the event loop.
+    if (polygon := await hass.async_add_executor_job(_load_zone_polygon, entry)) is not None:
+        domain_data[entry.entry_id] = polygon
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -21,6 +41,91 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        pass
+        hass.data[DOMAIN].pop(entry.entry_id, None)
 
     return unload_ok
+
+
+def _load_zone_polygon(entry: ConfigEntry) -> PreparedPolygon | None:
+    """Return the prepared zone polygon, or None when the stored polygon is unusable."""
+    name = entry.data[CONF_NAME]
+    try:
+        coords = parse_polygon_coords(entry.data[CONF_COORDINATES])
+    except (TypeError, ValueError) as err:
+        _LOGGER.error("Invalid polygon data for Custom Zone %s: %s", name, err)
+        return None
+
+    if len(coords) < MIN_POLYGON_POINTS:
+        _LOGGER.error("Custom Zone %s has fewer than %s polygon points", name, MIN_POLYGON_POINTS)
+        return None
+
+    return prepare_polygon(coords)
+
+
+@callback
+def async_track_tracker_state(
+    hass: HomeAssistant,
+    entity_ids: Iterable[str],
+    action: Callable[[Event[EventStateChangedData]], None],
+) -> CALLBACK_TYPE:
+    """Route tracker state changes to a zone through one shared listener per tracker.
+
+    Zones that watch the same tracker share a single state-change subscription, and the
+    event is handed to each zone's callback directly. Returns a callback that removes
+    the zone again and drops the subscription once no zone watches the tracker.
+
+    The action must be a synchronous ``@callback``: it runs inline on the event loop,
+    so a coroutine function would only create a coroutine that is never awaited.
+    """
+    if not is_callback(action):
+        raise TypeError("Tracker state actions must be decorated with @callback")
+
+    listeners: dict[str, dict[str, Any]] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_TRACKER_LISTENERS, {}
+    )
+    tracked_entity_ids = list(dict.fromkeys(entity_ids))
+
+    for entity_id in tracked_entity_ids:
+        tracker = listeners.get(entity_id)
+        if tracker is None:
+            zones: set[Callable[[Event[EventStateChangedData]], None]] = set()
+            tracker = listeners[entity_id] = {
+                "zones": zones,
+                "unsub": async_track_state_change_event(
+                    hass, [entity_id], _dispatcher(zones), job_type=HassJobType.Callback
+                ),
+            }
+        tracker["zones"].add(action)
+
+    @callback
+    def _async_remove() -> None:
+        for entity_id in tracked_entity_ids:
+            tracker = listeners.get(entity_id)
+            if tracker is None:
+                continue
+            tracker["zones"].discard(action)
+            if not tracker["zones"]:
+                tracker["unsub"]()
+                del listeners[entity_id]
+
+    return _async_remove
+
+
+def _dispatcher(
+    zones: set[Callable[[Event[EventStateChangedData]], None]],
+) -> Callable[[Event[EventStateChangedData]], None]:
+    """Return the shared state-change callback for one tracker.
+
+    Each zone's action is guarded like Home Assistant guards separate listeners, so an
+    error in one zone does not stop the event from reaching the other zones.
+    """
+
+    @callback
+    def _async_dispatch(event: Event[EventStateChangedData]) -> None:
+        for action in tuple(zones):
+            try:
+                action(event)
+            except Exception:
+                _LOGGER.exception("Error dispatching %s to %s", event.data["entity_id"], action)
+
+    return _async_dispatch
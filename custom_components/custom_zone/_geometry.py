@@ -0,0 +1,314 @@
+"""Polygon geometry for Custom Zone."""
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from functools import lru_cache, partial
+from typing import Any
+
+from .const import COORD_TOLERANCE
+
+# Cells per side of the uniform grid used to classify points without walking edges.
+POLYGON_GRID_SIZE = 16
+GRID_CELL_INSIDE = 1
+GRID_CELL_OUTSIDE = -1
+GRID_CELL_MIXED = 0
+
+METERS_PER_DEGREE_LATITUDE = 111_320.0
+
+COORD_TOLERANCE_SQUARED = COORD_TOLERANCE * COORD_TOLERANCE
+
+# Polygons with at most this many edges get a generated, fully unrolled edge walk.
+MAX_UNROLLED_EDGES = 32
+
+# Distinct polygons kept prepared across entry reloads.
+PREPARED_POLYGON_CACHE_SIZE = 64
+
+# Per-edge values the containment test needs, derived once from the vertices:
+# (p1x, p1y, p2y, dx, dy, boundary_limit, min_x, max_x, min_y, max_y), where the bounds are
+# the edge's bounding box widened by the tolerance.
+EdgeConstants = tuple[float, float, float, float, float, float, float, float, float, float]
+
+# Per-edge values the distance search needs, in degrees: (p1x, p1y, dx, dy, min_x, max_x,
+# min_y, max_y), where the bounds are the edge's exact bounding box.
+DistanceEdge = tuple[float, float, float, float, float, float, float, float]
+
+
+class PreparedPolygon:
+    """A zone polygon with its per-query lookup structures built once."""
+
+    __slots__ = (
+        "bbox",
+        "coords",
+        "distance_edges",
+        "edge_constants",
+        "edge_walk",
+        "edges",
+        "grid",
+        "grid_cell_height",
+        "grid_cell_width",
+    )
+
+    def __init__(self, polygon_coords: list[list[float]]) -> None:
+        """Prepare the polygon from [latitude, longitude] pairs."""
+        # The nested [lat, lon] lists are only kept for the entity's polygon attribute.
+        self.coords = polygon_coords
+        # Ray casting works on x=longitude, y=latitude. Each edge is a pre-rolled flat
+        # (p1x, p1y, p2x, p2y) float tuple, so queries walk the edges directly instead of
+        # re-indexing the nested lists with wrapping modulo.
+        poly_x = tuple(float(point[1]) for point in polygon_coords)
+        poly_y = tuple(float(point[0]) for point in polygon_coords)
+        if not all(map(math.isfinite, poly_x + poly_y)):
+            raise ValueError("Polygon coordinates must be finite")
+        self.edges = tuple(zip(poly_x, poly_y, poly_x[1:] + poly_x[:1], poly_y[1:] + poly_y[:1], strict=True))
+        # Bounding box (min_x, max_x, min_y, max_y) widened by the boundary tolerance, so
+        # points that are clearly far from the polygon are rejected without walking edges.
+        self.bbox = (
+            min(poly_x) - COORD_TOLERANCE,
+            max(poly_x) + COORD_TOLERANCE,
+            min(poly_y) - COORD_TOLERANCE,
+            max(poly_y) + COORD_TOLERANCE,
+        )
+        self.grid_cell_width = (self.bbox[1] - self.bbox[0]) / POLYGON_GRID_SIZE
+        self.grid_cell_height = (self.bbox[3] - self.bbox[2]) / POLYGON_GRID_SIZE
+        self.edge_constants = _build_edge_constants(self.edges)
+        self.distance_edges = tuple(
+            (p1x, p1y, p2x - p1x, p2y - p1y, min(p1x, p2x), max(p1x, p2x), min(p1y, p2y), max(p1y, p2y))
+            for p1x, p1y, p2x, p2y in self.edges
+        )
+        self.grid = _build_containment_grid(self.edge_constants, self.bbox, POLYGON_GRID_SIZE)
+        self.edge_walk: Callable[[float, float], bool] = (
+            _compile_edge_walk(self.edge_constants)
+            if len(self.edge_constants) <= MAX_UNROLLED_EDGES
+            else partial(point_in_polygon_xy, self.edge_constants)
+        )
+
+    def contains(self, lat: float, lon: float) -> bool:
+        """Return True when (lat, lon) is inside or on the boundary of the polygon."""
+        min_x, max_x, min_y, max_y = self.bbox
+        if not (min_x <= lon <= max_x and min_y <= lat <= max_y):
+            return False
+
+        column = min(int((lon - min_x) / self.grid_cell_width), POLYGON_GRID_SIZE - 1)
+        row = min(int((lat - min_y) / self.grid_cell_height), POLYGON_GRID_SIZE - 1)
+        cell = self.grid[row][column]
+        if cell != GRID_CELL_MIXED:
+            return cell == GRID_CELL_INSIDE
+
+        return self.edge_walk(lon, lat)
+
+    def boundary_distance_m(self, lat: float, lon: float) -> float:
+        """Return minimum distance in meters from point to polygon boundary."""
+        return polygon_boundary_distance_m(self.distance_edges, lat, lon)
+
+
+def parse_polygon_coords(raw_coords: Any) -> list[list[float]]:
+    """Return polygon coordinates from structured stored data."""
+    if not isinstance(raw_coords, list):
+        raise TypeError("Polygon coordinates must be a list")
+
+    normalized_coords: list[list[float]] = []
+    for point in raw_coords:
+        if not isinstance(point, list | tuple) or len(point) != 2:
+            raise ValueError("Polygon points must be two-item coordinate pairs")
+
+        try:
+            latitude = float(point[0])
+            longitude = float(point[1])
+        except (TypeError, ValueError) as err:
+            raise ValueError("Polygon points must contain numeric coordinates") from err
+
+        if not -90 <= latitude <= 90:
+            raise ValueError("Polygon latitude must be between -90 and 90")
+        if not -180 <= longitude <= 180:
+            raise ValueError("Polygon longitude must be between -180 and 180")
+
+        normalized_coords.append([latitude, longitude])
+
+    return normalized_coords
+
+
+def prepare_polygon(polygon_coords: list[list[float]]) -> PreparedPolygon:
+    """Return a prepared polygon for repeated containment and distance queries.
+
+    Prepared polygons are cached by their points, so reloading an entry or configuring
+    the same outline twice reuses the existing lookup structures.
+    """
+    return _prepare_polygon_cached(tuple((float(lat), float(lon)) for lat, lon in polygon_coords))
+
+
+@lru_cache(maxsize=PREPARED_POLYGON_CACHE_SIZE)
+def _prepare_polygon_cached(points: tuple[tuple[float, float], ...]) -> PreparedPolygon:
+    """Return the prepared polygon for a tuple of (latitude, longitude) points."""
+    return PreparedPolygon([[lat, lon] for lat, lon in points])
+
+
+def point_in_polygon_xy(edge_constants: tuple[EdgeConstants, ...], x: float, y: float) -> bool:
+    """Return True when (x, y) lies inside or on the boundary of the polygon.
+
+    The polygon is given as the prepared constants of its closed ring of edges.
+    """
+    inside = False
+    for p1x, p1y, p2y, dx, dy, boundary_limit, min_x, max_x, min_y, max_y in edge_constants:
+        rel_x = x - p1x
+        rel_y = y - p1y
+
+        # Vertex check
+        if abs(rel_x) < COORD_TOLERANCE and abs(rel_y) < COORD_TOLERANCE:
+            return True
+
+        # The cross product is the point's signed distance from the edge line scaled by the
+        # edge length. It decides both the boundary check and the ray-crossing side.
+        cross = dx * rel_y - dy * rel_x
+
+        # Boundary check: within the edge's widened bounding box and closer to the edge's
+        # line than the tolerance, compared as squares against the squared edge length.
+        if cross * cross < boundary_limit and min_x <= x <= max_x and min_y <= y <= max_y:
+            return True
+
+        # Ray casting: the edge straddles the ray's latitude and the point lies left of the
+        # edge when walking upwards.
+        if (p1y > y) != (p2y > y) and (cross > 0) == (dy > 0):
+            inside = not inside
+
+    return inside
+
+
+def polygon_boundary_distance_m(distance_edges: tuple[DistanceEdge, ...], lat: float, lon: float) -> float:
+    """Return minimum distance in meters from (lat, lon) to a closed ring of prepared edges.
+
+    Edges whose bounding box is already at least the best distance away along one axis
+    cannot be closer, so they are skipped without projecting the point onto them.
+    """
+    # Approximate degrees to meters at the current latitude.
+    meters_per_deg_lat = METERS_PER_DEGREE_LATITUDE
+    meters_per_deg_lon = meters_per_deg_lat * math.cos(math.radians(lat))
+
+    min_distance_squared = math.inf
+    min_distance = 0.0
+    reach_lat = reach_lon = math.inf
+    for p1x, p1y, edge_dx, edge_dy, min_x, max_x, min_y, max_y in distance_edges:
+        if lat - max_y > reach_lat or min_y - lat > reach_lat or lon - max_x > reach_lon or min_x - lon > reach_lon:
+            continue
+
+        # Work in local meters with the point at the origin.
+        x1 = (p1x - lon) * meters_per_deg_lon
+        y1 = (p1y - lat) * meters_per_deg_lat
+        dx = edge_dx * meters_per_deg_lon
+        dy = edge_dy * meters_per_deg_lat
+        length_squared = dx * dx + dy * dy
+        if length_squared:
+            t = max(0.0, min(1.0, (-(x1 * dx) - (y1 * dy)) / length_squared))
+            x1 += t * dx
+            y1 += t * dy
+        # Edges are compared by squared distance; the square root is only taken when an
+        # edge improves on the best so far, to narrow the bounding-box reach.
+        distance_squared = x1 * x1 + y1 * y1
+        if distance_squared < min_distance_squared:
+            min_distance_squared = distance_squared
+            min_distance = math.sqrt(distance_squared)
+            # The best distance so far, in degrees along each axis.
+            reach_lat = min_distance / meters_per_deg_lat
+            reach_lon = min_distance / meters_per_deg_lon if meters_per_deg_lon else math.inf
+
+    return min_distance
+
+
+def _build_edge_constants(edges: tuple[tuple[float, float, float, float], ...]) -> tuple[EdgeConstants, ...]:
+    """Return the per-edge containment constants for a closed ring of edges."""
+    constants: list[EdgeConstants] = []
+    for p1x, p1y, p2x, p2y in edges:
+        dx = p2x - p1x
+        dy = p2y - p1y
+        constants.append(
+            (
+                p1x,
+                p1y,
+                p2y,
+                dx,
+                dy,
+                COORD_TOLERANCE_SQUARED * (dx * dx + dy * dy),
+                min(p1x, p2x) - COORD_TOLERANCE,
+                max(p1x, p2x) + COORD_TOLERANCE,
+                min(p1y, p2y) - COORD_TOLERANCE,
+                max(p1y, p2y) + COORD_TOLERANCE,
+            )
+        )
+    return tuple(constants)
+
+
+def _compile_edge_walk(edge_constants: tuple[EdgeConstants, ...]) -> Callable[[float, float], bool]:
+    """Return point_in_polygon_xy specialised to one polygon, with the edge loop unrolled.
+
+    The prepared edge constants are baked into the generated source as literals, so the
+    result matches the kernel exactly. Only repr() of finite floats reaches the source.
+    """
+    if not all(math.isfinite(value) for constants in edge_constants for value in constants):
+        raise ValueError("Edge constants must be finite to compile an edge walk")
+
+    tol = repr(COORD_TOLERANCE)
+    lines = ["def edge_walk(x, y):", "    inside = False"]
+    for p1x, p1y, p2y, dx, dy, boundary_limit, min_x, max_x, min_y, max_y in edge_constants:
+        lines += [
+            f"    rel_x = x - {p1x!r}",
+            f"    rel_y = y - {p1y!r}",
+            f"    if -{tol} < rel_x < {tol} and -{tol} < rel_y < {tol}:",
+            "        return True",
+            f"    cross = {dx!r} * rel_y - {dy!r} * rel_x",
+            f"    if (cross * cross < {boundary_limit!r}"
+            f" and {min_x!r} <= x <= {max_x!r} and {min_y!r} <= y <= {max_y!r}):",
+            "        return True",
+        ]
+        # Horizontal edges never straddle the ray, so their crossing test is dropped.
+        if dy != 0:
+            lines += [
+                f"    if ({p1y!r} > y) != ({p2y!r} > y) and (cross > 0) == {dy > 0}:",
+                "        inside = not inside",
+            ]
+    lines.append("    return inside")
+
+    namespace: dict[str, Any] = {}
+    exec(compile("\n".join(lines), "<custom_zone edge walk>", "exec"), {"__builtins__": {}}, namespace)
+    return namespace["edge_walk"]
+
+
+def _build_containment_grid(
+    edge_constants: tuple[EdgeConstants, ...],
+    bbox: tuple[float, float, float, float],
+    size: int,
+) -> tuple[tuple[int, ...], ...]:
+    """Return a size x size grid of cell classifications over the bounding box.
+
+    A cell is mixed when it overlaps the tolerance-widened bounding box of any edge,
+    because vertex, boundary, and crossing decisions can all change inside it. Every
+    other cell contains no edge, so its centre decides the whole cell. Rows are indexed
+    by latitude and columns by longitude.
+    """
+    min_x, max_x, min_y, max_y = bbox
+    cell_width = (max_x - min_x) / size
+    cell_height = (max_y - min_y) / size
+    edge_boxes = [constants[6:] for constants in edge_constants]
+
+    rows: list[tuple[int, ...]] = []
+    for row in range(size):
+        cell_min_y = min_y + row * cell_height
+        cell_max_y = cell_min_y + cell_height
+        cells: list[int] = []
+        for column in range(size):
+            cell_min_x = min_x + column * cell_width
+            cell_max_x = cell_min_x + cell_width
+            if any(
+                edge_min_x <= cell_max_x
+                and cell_min_x <= edge_max_x
+                and edge_min_y <= cell_max_y
+                and cell_min_y <= edge_max_y
+                for edge_min_x, edge_max_x, edge_min_y, edge_max_y in edge_boxes
+            ):
+                cells.append(GRID_CELL_MIXED)
+            elif point_in_polygon_xy(edge_constants, (cell_min_x + cell_max_x) / 2, (cell_min_y + cell_max_y) / 2):
+                cells.append(GRID_CELL_INSIDE)
+            else:
+                cells.append(GRID_CELL_OUTSIDE)
+        rows.append(tuple(cells))
+
+    return tuple(rows)
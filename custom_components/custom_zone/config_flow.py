@@ -25,6 +25,15 @@ POLYGON_EDIT_MODE_KEEP = "keep"
 POLYGON_EDIT_MODE_REMOVE_LAST = "remove_last"
 POLYGON_EDIT_MODE_REPLACE = "replace"
 
+_SHAPE_NAMES = {
+    3: "Triangle",
+    4: "Quadrilateral (e.g. Rectangle)",
+    5: "Pentagon",
+    6: "Hexagon",
+    7: "Heptagon",
+    8: "Octagon",
+}
+
 
 class _PolygonFlowMixin:
     """Shared polygon-validation behavior for create and edit flows."""
@@ -46,19 +55,7 @@ class _PolygonFlowMixin:
         """Return a string describing the shape based on number of points."""
         if point_count < MIN_POLYGON_POINTS:
             return "Not a polygon yet"
-        if point_count == 3:
-            return "Triangle"
-        if point_count == 4:
-            return "Quadrilateral (e.g. Rectangle)"
-        if point_count == 5:
-            return "Pentagon"
-        if point_count == 6:
-            return "Hexagon"
-        if point_count == 7:
-            return "Heptagon"
-        if point_count == 8:
-            return "Octagon"
-        return f"{point_count}-sided polygon"
+        return _SHAPE_NAMES.get(point_count, f"{point_count}-sided polygon")
 
     def _validate_point(
         self, latitude: Any, longitude: Any
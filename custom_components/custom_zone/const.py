@@ -2,6 +2,9 @@
 
 DOMAIN = "custom_zone"
 
+# hass.data[DOMAIN] key holding the shared per-tracker state listeners.
+DATA_TRACKER_LISTENERS = "tracker_listeners"
+
 CONF_TRACKERS = "trackers"
 CONF_NAME = "name"
 CONF_COORDINATES = "coordinates"
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-import math
 from datetime import timedelta
 from typing import Any
 
@@ -17,18 +16,12 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.util import dt as dt_util
 from homeassistant.util import slugify
 
-from .const import (
-    CONF_COORDINATES,
-    CONF_NAME,
-    CONF_TRACKERS,
-    COORD_TOLERANCE,
-    DOMAIN,
-    MIN_POLYGON_POINTS,
-)
+from . import async_track_tracker_state
+from ._geometry import PreparedPolygon, prepare_polygon
+from .const import CONF_NAME, CONF_TRACKERS, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,63 +59,45 @@ async def async_setup_entry(
     if isinstance(trackers, str):
         trackers = [trackers]
 
-    try:
-        coords = _parse_polygon_coords(entry.data[CONF_COORDINATES])
-    except (TypeError, ValueError) as err:
-        _LOGGER.error("Invalid polygon data for Custom Zone %s: %s", name, err)
-        return
-
-    if len(coords) < MIN_POLYGON_POINTS:
-        _LOGGER.error("Custom Zone %s has fewer than %s polygon points", name, MIN_POLYGON_POINTS)
+    polygon = hass.data[DOMAIN].get(entry.entry_id)
+    if polygon is None:
+        # The integration setup already logged why the stored polygon was rejected.
         return
 
     _LOGGER.debug("Setting up Custom Zone: %s for trackers %s", name, trackers)
-    async_add_entities([CustomZoneSensor(entry.entry_id, name, trackers, coords)], True)
-
-
-def _parse_polygon_coords(raw_coords: Any) -> list[list[float]]:
-    """Return polygon coordinates from structured stored data."""
-    if not isinstance(raw_coords, list):
-        raise TypeError("Polygon coordinates must be a list")
-
-    normalized_coords: list[list[float]] = []
-    for point in raw_coords:
-        if not isinstance(point, list | tuple) or len(point) != 2:
-            raise ValueError("Polygon points must be two-item coordinate pairs")
-
-        try:
-            latitude = float(point[0])
-            longitude = float(point[1])
-        except (TypeError, ValueError) as err:
-            raise ValueError("Polygon points must contain numeric coordinates") from err
-
-        if not -90 <= latitude <= 90:
-            raise ValueError("Polygon latitude must be between -90 and 90")
-        if not -180 <= longitude <= 180:
-            raise ValueError("Polygon longitude must be between -180 and 180")
-
-        normalized_coords.append([latitude, longitude])
-
-    return normalized_coords
+    async_add_entities(
+        [CustomZoneSensor(entry.entry_id, name, trackers, polygon.coords, prepared_polygon=polygon)],
+        True,
+    )
 
 
 class CustomZoneSensor(SensorEntity):
     """Representation of a Custom Zone sensor."""
 
+    # Zone configuration only changes through a config-entry reload, so keep these
+    # attributes out of every recorded state row.
+    _unrecorded_attributes = frozenset({"polygon", "trackers"})
+
     def __init__(
         self,
         entry_id: str,
         name: str,
         tracker_entity_ids: list[str],
         polygon_coords: list[list[float]],
+        *,
+        prepared_polygon: PreparedPolygon | None = None,
     ) -> None:
         """Initialize the sensor."""
         self._attr_name = name
         self._attr_should_poll = False
         self._attr_unique_id = entry_id
         self._tracker_entity_ids = list(tracker_entity_ids)
-        self._polygon = polygon_coords
+        self._polygon = prepared_polygon or prepare_polygon(polygon_coords)
         self._trackers_inside: set[str] = set()
+        # Raw (latitude, longitude, gps_accuracy) of each tracker's last counted fix.
+        self._last_tracked_location: dict[str, tuple[Any, Any, Any]] = {}
+        # (latitude, longitude, is_inside, boundary_distance_m) of each tracker's last geometry query.
+        self._last_geometry: dict[str, tuple[float, float, bool, float]] = {}
         self._is_available = False
 
         zone_slug = slugify(name)
@@ -144,6 +119,7 @@ class CustomZoneSensor(SensorEntity):
             }
             for entity_id in self._tracker_entity_ids
         }
+        self._sorted_tracker_ids = sorted(self._tracker_data)
 
         self._attr_extra_state_attributes = {
             "trackers": self._tracker_entity_ids,
@@ -186,7 +162,7 @@ class CustomZoneSensor(SensorEntity):
             self._tracker_entity_ids,
         )
         self.async_on_remove(
-            async_track_state_change_event(
+            async_track_tracker_state(
                 self.hass,
                 self._tracker_entity_ids,
                 self._async_tracker_changed,
@@ -201,7 +177,10 @@ class CustomZoneSensor(SensorEntity):
 
     @callback
     def _async_tracker_changed(self, event) -> None:
-        """Handle tracker state changes."""
+        """Handle tracker state changes.
+
+        Must stay a synchronous callback: the shared tracker listener calls it inline.
+        """
         entity_id = event.data.get("entity_id")
         new_state = event.data.get("new_state")
         self._handle_tracker_state_update(entity_id, new_state)
@@ -213,10 +192,15 @@ class CustomZoneSensor(SensorEntity):
         status: str,
         diagnostic_reason: str,
         gps_accuracy_m: float | None = None,
-    ) -> None:
-        """Store an unusable tracker state with its diagnostic reason."""
+    ) -> bool:
+        """Store an unusable tracker state with its diagnostic reason.
+
+        Returns True when the stored tracker data changed.
+        """
         self._trackers_inside.discard(entity_id)
-        self._tracker_data[entity_id].update(
+        self._last_tracked_location.pop(entity_id, None)
+        return self._store_tracker_data(
+            entity_id,
             {
                 "lat": None,
                 "lon": None,
@@ -229,9 +213,18 @@ class CustomZoneSensor(SensorEntity):
                 "counted_in_zone": None,
                 "trusted_distance_m": None,
                 "gps_accuracy_m": gps_accuracy_m,
-            }
+            },
         )
 
+    def _store_tracker_data(self, entity_id: str, data: dict[str, Any]) -> bool:
+        """Replace the stored data for a tracker and return True when it changed."""
+        tracker_data = self._tracker_data[entity_id]
+        if tracker_data == data:
+            return False
+
+        tracker_data.update(data)
+        return True
+
     def _handle_tracker_state_update(
         self,
         entity_id: str,
@@ -243,86 +236,106 @@ class CustomZoneSensor(SensorEntity):
             return
 
         if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-            _LOGGER.debug("Tracker %s is unavailable or unknown", entity_id)
-            self._mark_tracker_unusable(
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Tracker %s is unavailable or unknown", entity_id)
+            changed = self._mark_tracker_unusable(
                 entity_id,
                 status=TRACKER_STATUS_UNAVAILABLE,
                 diagnostic_reason=DIAGNOSTIC_TRACKER_UNAVAILABLE,
             )
-            if fire_update:
+            if changed and fire_update:
                 self._update_state_and_attributes()
                 self.async_write_ha_state()
             return
 
-        lat = new_state.attributes.get(ATTR_LATITUDE)
-        lon = new_state.attributes.get(ATTR_LONGITUDE)
-        accuracy = new_state.attributes.get(ATTR_GPS_ACCURACY)
+        attributes = new_state.attributes
+        lat = attributes.get(ATTR_LATITUDE)
+        lon = attributes.get(ATTR_LONGITUDE)
+        accuracy = attributes.get(ATTR_GPS_ACCURACY)
+
+        # Trackers republish attribute-only changes (battery, etc.); a fresh fix at the
+        # same raw location and accuracy cannot change the classification.
+        if self._last_tracked_location.get(entity_id) == (lat, lon, accuracy) and not self._is_stale(new_state):
+            return
 
         if lat is None or lon is None:
-            _LOGGER.debug("Tracker %s has no coordinates", entity_id)
-            self._mark_tracker_unusable(
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Tracker %s has no coordinates", entity_id)
+            changed = self._mark_tracker_unusable(
                 entity_id,
                 status=TRACKER_STATUS_NO_COORDINATES,
                 diagnostic_reason=DIAGNOSTIC_CONFIDENCE_DATA_MISSING,
             )
-            if fire_update:
+            if changed and fire_update:
                 self._update_state_and_attributes()
                 self.async_write_ha_state()
             return
 
-        try:
-            latitude = float(lat)
-            longitude = float(lon)
-        except (TypeError, ValueError):
-            _LOGGER.warning("Invalid coordinates for tracker %s", entity_id)
-            self._mark_tracker_unusable(
-                entity_id,
-                status=TRACKER_STATUS_INVALID_COORDINATES,
-                diagnostic_reason=DIAGNOSTIC_CONFIDENCE_DATA_INVALID,
-            )
-            if fire_update:
-                self._update_state_and_attributes()
-                self.async_write_ha_state()
-            return
+        # Trackers normally publish float coordinates; only other types need coercing.
+        latitude = lat
+        longitude = lon
+        if type(latitude) is not float or type(longitude) is not float:
+            try:
+                latitude = float(lat)
+                longitude = float(lon)
+            except (TypeError, ValueError):
+                _LOGGER.warning("Invalid coordinates for tracker %s", entity_id)
+                changed = self._mark_tracker_unusable(
+                    entity_id,
+                    status=TRACKER_STATUS_INVALID_COORDINATES,
+                    diagnostic_reason=DIAGNOSTIC_CONFIDENCE_DATA_INVALID,
+                )
+                if changed and fire_update:
+                    self._update_state_and_attributes()
+                    self.async_write_ha_state()
+                return
 
         if self._is_stale(new_state):
             stale_accuracy_m, _ = self._parse_accuracy_meters(accuracy)
-            self._mark_tracker_unusable(
+            changed = self._mark_tracker_unusable(
                 entity_id,
                 status=DIAGNOSTIC_STALE_LOCATION,
                 diagnostic_reason=DIAGNOSTIC_STALE_LOCATION,
                 gps_accuracy_m=stale_accuracy_m,
             )
-            if fire_update:
+            if changed and fire_update:
                 self._update_state_and_attributes()
                 self.async_write_ha_state()
             return
 
         accuracy_m, accuracy_reason = self._parse_accuracy_meters(accuracy)
         if accuracy_reason is not None:
-            self._mark_tracker_unusable(
+            changed = self._mark_tracker_unusable(
                 entity_id,
                 status=accuracy_reason,
                 diagnostic_reason=accuracy_reason,
             )
-            if fire_update:
+            if changed and fire_update:
                 self._update_state_and_attributes()
                 self.async_write_ha_state()
             return
 
-        is_inside = self._point_in_polygon(latitude, longitude)
-        boundary_distance_m = self._distance_to_polygon_meters(latitude, longitude)
+        # Geometry only depends on the coordinates, so a new accuracy at the same location
+        # reuses the previous containment and distance results.
+        last_geometry = self._last_geometry.get(entity_id)
+        if last_geometry is not None and last_geometry[0] == latitude and last_geometry[1] == longitude:
+            is_inside = last_geometry[2]
+            boundary_distance_m = last_geometry[3]
+        else:
+            is_inside = self._point_in_polygon(latitude, longitude)
+            boundary_distance_m = self._distance_to_polygon_meters(latitude, longitude)
+            self._last_geometry[entity_id] = (latitude, longitude, is_inside, boundary_distance_m)
         trusted_distance_m = round(boundary_distance_m, 2) if boundary_distance_m is not None else None
         confidence_limit_m = boundary_distance_m * CONFIDENCE_SAFETY_MARGIN_FACTOR
 
         if accuracy_m is None or boundary_distance_m is None or accuracy_m > confidence_limit_m:
-            self._mark_tracker_unusable(
+            changed = self._mark_tracker_unusable(
                 entity_id,
                 status=DIAGNOSTIC_CONFIDENCE_FAILURE,
                 diagnostic_reason=DIAGNOSTIC_CONFIDENCE_FAILURE,
                 gps_accuracy_m=accuracy_m,
             )
-            if fire_update:
+            if changed and fire_update:
                 self._update_state_and_attributes()
                 self.async_write_ha_state()
             return
@@ -333,7 +346,8 @@ class CustomZoneSensor(SensorEntity):
             else TRACKER_CLASSIFICATION_COUNTED_OUT_OF_ZONE
         )
 
-        self._tracker_data[entity_id].update(
+        changed = self._store_tracker_data(
+            entity_id,
             {
                 "lat": latitude,
                 "lon": longitude,
@@ -346,35 +360,34 @@ class CustomZoneSensor(SensorEntity):
                 "counted_in_zone": is_inside,
                 "trusted_distance_m": trusted_distance_m,
                 "gps_accuracy_m": accuracy_m,
-            }
+            },
         )
 
+        self._last_tracked_location[entity_id] = (lat, lon, accuracy)
+
         if is_inside:
             self._trackers_inside.add(entity_id)
         else:
             self._trackers_inside.discard(entity_id)
 
-        if fire_update:
+        if changed and fire_update:
             self._update_state_and_attributes()
             self.async_write_ha_state()
 
     def _update_state_and_attributes(self) -> None:
         """Update the sensor attributes based on current tracker data."""
-        in_zone = sorted(
-            entity_id
-            for entity_id, data in self._tracker_data.items()
-            if data["classification"] == TRACKER_CLASSIFICATION_COUNTED_IN_ZONE
-        )
-        out_zone = sorted(
-            entity_id
-            for entity_id, data in self._tracker_data.items()
-            if data["classification"] == TRACKER_CLASSIFICATION_COUNTED_OUT_OF_ZONE
-        )
-        unavailable = sorted(
-            entity_id
-            for entity_id, data in self._tracker_data.items()
-            if data["classification"] == TRACKER_CLASSIFICATION_UNUSABLE
-        )
+        in_zone: list[str] = []
+        out_zone: list[str] = []
+        unavailable: list[str] = []
+        buckets = {
+            TRACKER_CLASSIFICATION_COUNTED_IN_ZONE: in_zone,
+            TRACKER_CLASSIFICATION_COUNTED_OUT_OF_ZONE: out_zone,
+            TRACKER_CLASSIFICATION_UNUSABLE: unavailable,
+        }
+        # Walking the trackers in sorted order keeps each list sorted without re-sorting.
+        tracker_data = self._tracker_data
+        for entity_id in self._sorted_tracker_ids:
+            buckets[tracker_data[entity_id]["classification"]].append(entity_id)
 
         self._trackers_inside = set(in_zone)
         self._is_available = True
@@ -389,60 +402,18 @@ class CustomZoneSensor(SensorEntity):
             for entity_id, data in self._tracker_data.items()
         }
 
-        self._attr_extra_state_attributes.update(
-            {
-                "trackers_in_zone": in_zone,
-                "trackers_out_of_zone": out_zone,
-                "trackers_unusable": unavailable,
-                "count_in_zone": len(in_zone),
-                "count_out_of_zone": len(out_zone),
-                "count_unusable": len(unavailable),
-                "trackers_detail": trackers_detail,
-            }
-        )
+        attributes = self._attr_extra_state_attributes
+        attributes["trackers_in_zone"] = in_zone
+        attributes["trackers_out_of_zone"] = out_zone
+        attributes["trackers_unusable"] = unavailable
+        attributes["count_in_zone"] = len(in_zone)
+        attributes["count_out_of_zone"] = len(out_zone)
+        attributes["count_unusable"] = len(unavailable)
+        attributes["trackers_detail"] = trackers_detail
 
     def _point_in_polygon(self, lat, lon):
         """Check if point (lat, lon) is inside the polygon."""
-        # Ray casting expects x=longitude, y=latitude. Polygon points are stored as [lat, lon].
-        x = lon
-        y = lat
-        poly = self._polygon
-        n = len(poly)
-
-        for i in range(n):
-            p1 = poly[i]
-            p2 = poly[(i + 1) % n]
-            p1x, p1y = p1[1], p1[0]
-            p2x, p2y = p2[1], p2[0]
-
-            # Vertex check
-            if abs(p1x - x) < COORD_TOLERANCE and abs(p1y - y) < COORD_TOLERANCE:
-                return True
-
-            # Boundary check
-            if x >= min(p1x, p2x) - COORD_TOLERANCE and x <= max(p1x, p2x) + COORD_TOLERANCE and \
-               y >= min(p1y, p2y) - COORD_TOLERANCE and y <= max(p1y, p2y) + COORD_TOLERANCE:
-                 # Collinear check
-                 cross = (y - p1y) * (p2x - p1x) - (p2y - p1y) * (x - p1x)
-                 if abs(cross) < COORD_TOLERANCE:
-                     return True
-
-        inside = False
-        p1x, p1y = poly[-1][1], poly[-1][0]
-        for i in range(n):
-            p2x, p2y = poly[i][1], poly[i][0]
-
-            # Ray casting algorithm
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xints = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                            if p1x == p2x or x <= xints:
-                                inside = not inside
-            p1x, p1y = p2x, p2y
-
-        return inside
+        return self._polygon.contains(lat, lon)
 
     def _parse_accuracy_meters(self, accuracy):
         """Return parsed accuracy meters and a diagnostic reason when unusable."""
@@ -467,35 +438,4 @@ class CustomZoneSensor(SensorEntity):
 
     def _distance_to_polygon_meters(self, lat, lon):
         """Return minimum distance in meters from point to polygon boundary."""
-        # Approximate degrees to meters at the current latitude.
-        lat_rad = math.radians(lat)
-        meters_per_deg_lat = 111_320.0
-        meters_per_deg_lon = meters_per_deg_lat * math.cos(lat_rad)
-
-        def to_xy(p_lat, p_lon):
-            return (
-                (p_lon - lon) * meters_per_deg_lon,
-                (p_lat - lat) * meters_per_deg_lat,
-            )
-
-        min_distance = None
-        n = len(self._polygon)
-        for i in range(n):
-            p1_lat, p1_lon = self._polygon[i]
-            p2_lat, p2_lon = self._polygon[(i + 1) % n]
-            x1, y1 = to_xy(p1_lat, p1_lon)
-            x2, y2 = to_xy(p2_lat, p2_lon)
-            dx = x2 - x1
-            dy = y2 - y1
-            if dx == 0 and dy == 0:
-                distance = math.hypot(x1, y1)
-            else:
-                t = (-(x1 * dx) - (y1 * dy)) / (dx * dx + dy * dy)
-                t = max(0.0, min(1.0, t))
-                proj_x = x1 + t * dx
-                proj_y = y1 + t * dy
-                distance = math.hypot(proj_x, proj_y)
-            if min_distance is None or distance < min_distance:
-                min_distance = distance
-
-        return min_distance if min_distance is not None else 0.0
+        return self._polygon.boundary_distance_m(lat, lon)
@@ -4,6 +4,7 @@ from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
 from homeassistant.data_entry_flow import FlowResultType
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.custom_zone.config_flow import CustomZoneConfigFlow
 from custom_components.custom_zone.const import (
     CONF_COORDINATES,
     CONF_NAME,
@@ -50,6 +51,17 @@ async def _setup_entry(hass, name: str, trackers: list[str], coordinates: list[l
     return entry
 
 
+def test_shape_description_names_common_polygons() -> None:
+    """Known point counts should get a shape name and larger ones a generic label."""
+    flow = CustomZoneConfigFlow()
+
+    assert flow._get_shape_description(2) == "Not a polygon yet"
+    assert flow._get_shape_description(3) == "Triangle"
+    assert flow._get_shape_description(4) == "Quadrilateral (e.g. Rectangle)"
+    assert flow._get_shape_description(8) == "Octagon"
+    assert flow._get_shape_description(9) == "9-sided polygon"
+
+
 async def test_duplicate_zone_name_is_rejected(hass) -> None:
     """Zone names should be unique across config entries."""
     entry = MockConfigEntry(
@@ -0,0 +1,169 @@
+"""Tests for the Custom Zone polygon geometry helpers."""
+
+from __future__ import annotations
+
+import math
+from functools import partial
+
+import pytest
+
+from custom_components.custom_zone._geometry import (
+    GRID_CELL_INSIDE,
+    GRID_CELL_MIXED,
+    GRID_CELL_OUTSIDE,
+    MAX_UNROLLED_EDGES,
+    METERS_PER_DEGREE_LATITUDE,
+    _compile_edge_walk,
+    point_in_polygon_xy,
+    polygon_boundary_distance_m,
+    prepare_polygon,
+)
+
+SQUARE_POLYGON = [[0, 0], [0, 1], [1, 1], [1, 0]]
+CONCAVE_POLYGON = [[0, 0], [0, 3], [3, 3], [3, 2], [1, 2], [1, 0]]
+
+
+def test_bounding_box_reject_keeps_boundary_tolerance() -> None:
+    """Points within tolerance of an extreme vertex must not be rejected by the bounding box."""
+    polygon = prepare_polygon(SQUARE_POLYGON)
+
+    assert polygon.contains(1.000005, 1.000005) is True
+    assert polygon.contains(-0.000005, 0.5) is True
+    assert polygon.contains(45.0, 90.0) is False
+
+
+def test_boundary_tolerance_is_a_distance_from_short_diagonal_edges() -> None:
+    """Short diagonal edges should only absorb points within the tolerance distance."""
+    polygon = prepare_polygon([[0, 0], [0, 0.0001], [0.0001, 0.0001]])
+
+    # About 0.5 m outside the diagonal edge counts as on the boundary.
+    assert polygon.contains(0.0000535, 0.0000465) is True
+    # About 3 m outside the diagonal edge is outside, even within the edge's bounding box.
+    assert polygon.contains(0.00006, 0.00002) is False
+
+
+def test_containment_grid_matches_edge_walk() -> None:
+    """Grid lookups should agree with the full edge walk across the bounding box."""
+    polygon = prepare_polygon(CONCAVE_POLYGON)
+
+    cells = {cell for row in polygon.grid for cell in row}
+    assert cells == {GRID_CELL_INSIDE, GRID_CELL_OUTSIDE, GRID_CELL_MIXED}
+
+    steps = 61
+    for lat_step in range(steps):
+        for lon_step in range(steps):
+            lat = -0.05 + 3.1 * lat_step / (steps - 1)
+            lon = -0.05 + 3.1 * lon_step / (steps - 1)
+            expected = point_in_polygon_xy(polygon.edge_constants, lon, lat)
+            assert polygon.contains(lat, lon) is expected
+
+
+def test_edges_close_the_ring_in_x_y_order() -> None:
+    """Prepared edges should run vertex to vertex as (lon, lat) pairs and wrap to the start."""
+    polygon = prepare_polygon([[0, 10], [0, 11], [1, 11]])
+
+    assert polygon.edges == (
+        (10.0, 0.0, 11.0, 0.0),
+        (11.0, 0.0, 11.0, 1.0),
+        (11.0, 1.0, 10.0, 0.0),
+    )
+
+
+def test_unrolled_edge_walk_matches_the_kernel() -> None:
+    """The generated per-polygon edge walk should agree with the generic kernel exactly."""
+    triangle = [[0, 0], [2, 0], [1, 1]]
+    for coords in (SQUARE_POLYGON, CONCAVE_POLYGON, triangle):
+        polygon = prepare_polygon(coords)
+        probes = [
+            (p1x + t * (p2x - p1x), p1y + t * (p2y - p1y))
+            for p1x, p1y, p2x, p2y in polygon.edges
+            for t in (0, 0.5)
+        ]
+        probes += [(-0.1 + 3.2 * i / 40, -0.1 + 3.2 * j / 40) for i in range(41) for j in range(41)]
+
+        for x, y in probes:
+            assert polygon.edge_walk(x, y) is point_in_polygon_xy(polygon.edge_constants, x, y)
+
+
+def test_large_polygons_fall_back_to_the_generic_kernel() -> None:
+    """Polygons above the unroll limit should keep using the shared kernel."""
+    vertex_count = MAX_UNROLLED_EDGES + 1
+    circle = [
+        [math.sin(2 * math.pi * index / vertex_count), math.cos(2 * math.pi * index / vertex_count)]
+        for index in range(vertex_count)
+    ]
+    polygon = prepare_polygon(circle)
+
+    assert isinstance(polygon.edge_walk, partial)
+    assert polygon.contains(0.0, 0.0) is True
+    assert polygon.contains(0.75, 0.75) is False
+
+
+def test_boundary_distance_uses_the_nearest_edge() -> None:
+    """Distances should be measured to the closest edge from inside and outside the polygon."""
+    polygon = prepare_polygon(SQUARE_POLYGON)
+
+    assert math.isclose(polygon.boundary_distance_m(0.1, 0.5), 0.1 * METERS_PER_DEGREE_LATITUDE)
+    assert math.isclose(
+        polygon.boundary_distance_m(0.5, 1.5),
+        0.5 * METERS_PER_DEGREE_LATITUDE * math.cos(math.radians(0.5)),
+    )
+
+
+def test_boundary_distance_handles_repeated_vertices() -> None:
+    """Zero-length edges from repeated vertices should measure to the vertex itself."""
+    distance_edges = prepare_polygon([[0, 0], [0, 0], [0, 1], [1, 1]]).distance_edges
+
+    assert math.isclose(polygon_boundary_distance_m(distance_edges, -0.1, 0.0), 0.1 * METERS_PER_DEGREE_LATITUDE)
+
+
+def test_boundary_distance_pruning_matches_a_full_scan() -> None:
+    """Skipping far edges by their bounding boxes must not change the nearest distance."""
+    polygon = prepare_polygon(CONCAVE_POLYGON)
+    unpruned_edges = tuple(
+        (p1x, p1y, dx, dy, -math.inf, math.inf, -math.inf, math.inf)
+        for p1x, p1y, dx, dy, *_bounds in polygon.distance_edges
+    )
+
+    steps = 25
+    for lat_step in range(steps):
+        for lon_step in range(steps):
+            lat = -1.0 + 5.0 * lat_step / (steps - 1)
+            lon = -1.0 + 5.0 * lon_step / (steps - 1)
+            expected = polygon_boundary_distance_m(unpruned_edges, lat, lon)
+            assert polygon.boundary_distance_m(lat, lon) == expected
+
+
+def test_prepared_polygons_are_reused_for_the_same_points() -> None:
+    """Preparing the same outline again should reuse the cached lookup structures."""
+    polygon = prepare_polygon([[0, 0], [0, 2], [2, 2], [2, 0]])
+
+    assert prepare_polygon([[0.0, 0.0], [0.0, 2.0], [2.0, 2.0], [2.0, 0.0]]) is polygon
+    assert prepare_polygon([[0, 0], [0, 2], [2, 2], [2, 1]]) is not polygon
+    assert polygon.coords == [[0.0, 0.0], [0.0, 2.0], [2.0, 2.0], [2.0, 0.0]]
+
+
+def test_boundary_distance_uses_the_longitude_scale_at_the_point() -> None:
+    """Longitude distances should be scaled by the cosine of the point's own latitude."""
+    polygon = prepare_polygon([[59.9, 10.0], [59.9, 10.2], [60.1, 10.2], [60.1, 10.0]])
+    lat = 60.00004999
+    lon = 10.3
+
+    expected = 0.1 * METERS_PER_DEGREE_LATITUDE * math.cos(math.radians(lat))
+    assert math.isclose(polygon.boundary_distance_m(lat, lon), expected)
+
+
+@pytest.mark.parametrize("bad_value", [math.inf, -math.inf, math.nan])
+def test_non_finite_vertices_are_rejected(bad_value: float) -> None:
+    """Non-finite vertices must not reach the generated edge walk."""
+    with pytest.raises(ValueError, match="finite"):
+        prepare_polygon([[0, 0], [0, 1], [bad_value, 0]])
+
+
+def test_edge_walk_generator_rejects_non_finite_constants() -> None:
+    """The generator should refuse constants that repr() would not write as float literals."""
+    edge_constants = prepare_polygon(SQUARE_POLYGON).edge_constants
+    overflowed = ((*edge_constants[0][:5], math.inf, *edge_constants[0][6:]), *edge_constants[1:])
+
+    with pytest.raises(ValueError, match="finite"):
+        _compile_edge_walk(overflowed)
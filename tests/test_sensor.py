@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
 
 import pytest
 from homeassistant.const import ATTR_GPS_ACCURACY, ATTR_LATITUDE, ATTR_LONGITUDE, STATE_UNAVAILABLE
+from homeassistant.core import callback, is_callback
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.custom_zone import async_track_tracker_state
 from custom_components.custom_zone.const import (
     CONF_COORDINATES,
     CONF_NAME,
     CONF_TRACKERS,
     CONF_ZONE_TYPE,
+    DATA_TRACKER_LISTENERS,
     DOMAIN,
     ZONE_TYPE_POLYGON,
 )
@@ -292,6 +297,112 @@ async def test_trackers_detail_is_keyed_by_full_entity_id(hass) -> None:
     assert "person_john_smith_in_zone" not in state.attributes
 
 
+async def test_zones_sharing_a_tracker_share_one_listener(hass) -> None:
+    """Zones watching the same tracker should be routed through one subscription."""
+    hass.states.async_set(
+        "person.alice",
+        "home",
+        {
+            ATTR_LATITUDE: 2.0,
+            ATTR_LONGITUDE: 2.0,
+            ATTR_GPS_ACCURACY: 5,
+        },
+    )
+    first = await _setup_entry(hass, "Front Garden", ["person.alice"])
+    await _setup_entry(hass, "Back Garden", ["person.alice"])
+
+    listeners = hass.data[DOMAIN][DATA_TRACKER_LISTENERS]
+    assert list(listeners) == ["person.alice"]
+    assert len(listeners["person.alice"]["zones"]) == 2
+
+    hass.states.async_set(
+        "person.alice",
+        "home",
+        {
+            ATTR_LATITUDE: 0.5,
+            ATTR_LONGITUDE: 0.5,
+            ATTR_GPS_ACCURACY: 5,
+        },
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.customzone_front_garden").state == "1 in zone"
+    assert hass.states.get("sensor.customzone_back_garden").state == "1 in zone"
+
+    assert await hass.config_entries.async_unload(first.entry_id)
+    await hass.async_block_till_done()
+    assert len(listeners["person.alice"]["zones"]) == 1
+
+    hass.states.async_set("person.alice", STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.customzone_back_garden").state == "0 in zone"
+
+
+async def test_failing_zone_does_not_block_other_zones_on_a_tracker(hass, caplog) -> None:
+    """An error in one zone's handler should not stop delivery to the other zones."""
+    received: list[str] = []
+
+    def _failing_action(zone: str):
+        @callback
+        def _action(event) -> None:
+            received.append(zone)
+            raise ValueError(f"{zone} failed")
+
+        return _action
+
+    remove_first = async_track_tracker_state(hass, ["person.alice"], _failing_action("first"))
+    remove_second = async_track_tracker_state(hass, ["person.alice"], _failing_action("second"))
+
+    hass.states.async_set("person.alice", "home")
+    await hass.async_block_till_done()
+
+    assert sorted(received) == ["first", "second"]
+    assert caplog.text.count("Error dispatching person.alice") == 2
+
+    remove_first()
+    remove_second()
+
+
+async def test_zone_keeps_updating_when_another_zone_on_the_tracker_fails(hass) -> None:
+    """A zone should still update when another zone watching the same tracker raises."""
+    await _setup_entry(hass, "Front Garden", ["person.alice"])
+
+    @callback
+    def _broken_zone(event) -> None:
+        raise ValueError("broken zone")
+
+    remove_broken = async_track_tracker_state(hass, ["person.alice"], _broken_zone)
+
+    hass.states.async_set(
+        "person.alice",
+        "home",
+        {
+            ATTR_LATITUDE: 0.5,
+            ATTR_LONGITUDE: 0.5,
+            ATTR_GPS_ACCURACY: 5,
+        },
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.customzone_front_garden").state == "1 in zone"
+
+    remove_broken()
+
+
+def test_tracker_change_handler_is_a_synchronous_callback() -> None:
+    """The tracker handler must stay a plain callback so events are handled inline."""
+    assert not asyncio.iscoroutinefunction(CustomZoneSensor._async_tracker_changed)
+    assert is_callback(CustomZoneSensor._async_tracker_changed)
+
+
+async def test_tracker_listener_rejects_non_callback_actions(hass) -> None:
+    """Registering a coroutine handler should fail loudly instead of dropping events."""
+
+    async def _handler(event) -> None:
+        """Handle an event asynchronously."""
+
+    with pytest.raises(TypeError):
+        async_track_tracker_state(hass, ["person.alice"], _handler)
+
+
 async def test_sensor_starts_with_all_trackers_unusable_when_no_states_exist(hass) -> None:
     """A zone should still load when trackers have no current Home Assistant state."""
     await _setup_entry(hass, "Offline Zone", ["person.alice", "person.bob"])
@@ -436,6 +547,26 @@ async def test_low_confidence_inside_fix_is_not_counted_in_zone(hass) -> None:
     assert detail["trusted_distance_m"] is None
 
 
+def test_non_float_numeric_coordinates_are_still_coerced() -> None:
+    """Integer and numeric-string coordinates should be accepted like floats."""
+    sensor = CustomZoneSensor("entry-id", "Driveway", ["person.alice"], SQUARE_POLYGON)
+
+    sensor._handle_tracker_state_update(
+        "person.alice",
+        MockState("home", latitude="0.5", longitude=0.5, gps_accuracy=5),
+        fire_update=False,
+    )
+    assert sensor._tracker_data["person.alice"]["lat"] == pytest.approx(0.5)
+    assert sensor._tracker_data["person.alice"]["classification"] == "counted_in_zone"
+
+    sensor._handle_tracker_state_update(
+        "person.alice",
+        MockState("home", latitude=2, longitude=2, gps_accuracy=5),
+        fire_update=False,
+    )
+    assert sensor._tracker_data["person.alice"]["classification"] == "counted_out_of_zone"
+
+
 def test_missing_accuracy_marks_tracker_unusable() -> None:
     """A fix without usable accuracy data should not be counted."""
     sensor = CustomZoneSensor("entry-id", "Driveway", ["person.alice"], SQUARE_POLYGON)
@@ -455,6 +586,110 @@ def test_missing_accuracy_marks_tracker_unusable() -> None:
     assert detail["trusted_distance_m"] is None
 
 
+def test_unchanged_location_skips_geometry() -> None:
+    """Republishes at the same coordinates should not re-run the geometry."""
+    sensor = CustomZoneSensor("entry-id", "Driveway", ["person.alice"], SQUARE_POLYGON)
+    sensor._handle_tracker_state_update(
+        "person.alice",
+        MockState("home", latitude=0.5, longitude=0.5, gps_accuracy=5, battery=90),
+        fire_update=False,
+    )
+    sensor._point_in_polygon = Mock(wraps=sensor._point_in_polygon)
+
+    sensor._handle_tracker_state_update(
+        "person.alice",
+        MockState("home", latitude=0.5, longitude=0.5, gps_accuracy=5, battery=80),
+        fire_update=False,
+    )
+    assert sensor._point_in_polygon.call_count == 0
+    assert sensor._tracker_data["person.alice"]["classification"] == "counted_in_zone"
+
+    sensor._handle_tracker_state_update(
+        "person.alice",
+        MockState("home", latitude=0.5, longitude=0.5, gps_accuracy=6, battery=80),
+        fire_update=False,
+    )
+    assert sensor._point_in_polygon.call_count == 0
+    assert sensor._tracker_data["person.alice"]["gps_accuracy_m"] == 6.0
+
+    sensor._handle_tracker_state_update(
+        "person.alice",
+        MockState("home", latitude=0.6, longitude=0.5, gps_accuracy=6, battery=80),
+        fire_update=False,
+    )
+    assert sensor._point_in_polygon.call_count == 1
+
+
+def test_accuracy_change_at_same_location_reuses_distance() -> None:
+    """A poor fix at cached coordinates should still fail confidence against the cached distance."""
+    sensor = CustomZoneSensor("entry-id", "Driveway", ["person.alice"], SQUARE_POLYGON)
+    sensor._handle_tracker_state_update(
+        "person.alice",
+        MockState("home", latitude=0.5, longitude=0.5, gps_accuracy=5),
+        fire_update=False,
+    )
+    sensor._distance_to_polygon_meters = Mock(wraps=sensor._distance_to_polygon_meters)
+
+    sensor._handle_tracker_state_update(
+        "person.alice",
+        MockState("home", latitude=0.5, longitude=0.5, gps_accuracy=100_000),
+        fire_update=False,
+    )
+    assert sensor._tracker_data["person.alice"]["classification"] == "unusable"
+
+    sensor._handle_tracker_state_update(
+        "person.alice",
+        MockState("home", latitude=0.5, longitude=0.5, gps_accuracy=5),
+        fire_update=False,
+    )
+    assert sensor._distance_to_polygon_meters.call_count == 0
+    assert sensor._tracker_data["person.alice"]["classification"] == "counted_in_zone"
+
+
+def test_tracker_lists_are_sorted_regardless_of_configured_order() -> None:
+    """Attribute lists should be sorted by entity id, not by configuration order."""
+    sensor = CustomZoneSensor(
+        "entry-id", "Driveway", ["person.zed", "person.bob", "person.alice", "person.carol"], SQUARE_POLYGON
+    )
+    for entity_id in ("person.zed", "person.alice"):
+        sensor._handle_tracker_state_update(
+            entity_id,
+            MockState("home", latitude=0.5, longitude=0.5, gps_accuracy=5),
+            fire_update=False,
+        )
+    sensor._handle_tracker_state_update(
+        "person.carol",
+        MockState("home", latitude=5.0, longitude=5.0, gps_accuracy=5),
+        fire_update=False,
+    )
+    sensor._update_state_and_attributes()
+
+    attributes = sensor._attr_extra_state_attributes
+    assert attributes["trackers_in_zone"] == ["person.alice", "person.zed"]
+    assert attributes["trackers_out_of_zone"] == ["person.carol"]
+    assert attributes["trackers_unusable"] == ["person.bob"]
+
+
+def test_state_is_only_written_when_tracker_data_changes() -> None:
+    """Repeated identical tracker outcomes should not publish no-op state writes."""
+    sensor = CustomZoneSensor("entry-id", "Driveway", ["person.alice"], SQUARE_POLYGON)
+    sensor.async_write_ha_state = Mock()
+
+    sensor._handle_tracker_state_update("person.alice", MockState(STATE_UNAVAILABLE))
+    assert sensor.async_write_ha_state.call_count == 0
+
+    sensor._handle_tracker_state_update(
+        "person.alice",
+        MockState("home", latitude=0.5, longitude=0.5, gps_accuracy=5),
+    )
+    assert sensor.async_write_ha_state.call_count == 1
+
+    sensor._handle_tracker_state_update("person.alice", MockState(STATE_UNAVAILABLE))
+    sensor._handle_tracker_state_update("person.alice", MockState(STATE_UNAVAILABLE))
+    assert sensor.async_write_ha_state.call_count == 2
+    assert sensor.native_value == "0 in zone"
+
+
 def test_stale_location_marks_tracker_unusable() -> None:
     """An old tracker fix should be excluded from counting."""
     sensor = CustomZoneSensor("entry-id", "Driveway", ["person.alice"], SQUARE_POLYGON)
@@ -600,6 +835,18 @@ async def test_documented_aggregate_attributes_are_present(hass) -> None:
         assert attribute in state.attributes
 
 
+async def test_static_zone_attributes_are_published_but_not_recorded(hass) -> None:
+    """The polygon and tracker list stay visible but are excluded from the recorder."""
+    await _setup_entry(hass, "Static Zone", ["person.alice"])
+
+    state = hass.states.get("sensor.customzone_static_zone")
+    assert state is not None
+    assert state.attributes["polygon"] == [[0.0, 0.0], [0.0, 1.0], [1.0, 1.0], [1.0, 0.0]]
+    assert state.attributes["trackers"] == ["person.alice"]
+    assert {"polygon", "trackers"} <= CustomZoneSensor._unrecorded_attributes
+    assert "trackers_detail" not in CustomZoneSensor._unrecorded_attributes
+
+
 async def test_string_coordinate_entries_are_rejected(hass) -> None:
     """Non-structured coordinate storage should fail safely at setup time."""
     hass.states.async_set(
@@ -658,6 +905,19 @@ async def test_malformed_structured_coordinate_entries_are_rejected(hass) -> Non
     assert state is None
 
 
+async def test_prepared_polygon_is_shared_with_the_platform_and_dropped_on_unload(hass) -> None:
+    """The integration should parse the polygon once and release it on unload."""
+    entry = await _setup_entry(hass, "Prepared Zone", ["person.alice"])
+
+    polygon = hass.data[DOMAIN][entry.entry_id]
+    assert polygon.coords == [[0.0, 0.0], [0.0, 1.0], [1.0, 1.0], [1.0, 0.0]]
+    assert polygon.contains(0.5, 0.5) is True
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.entry_id not in hass.data[DOMAIN]
+
+
 async def test_unload_and_reload_restore_runtime_behavior(hass) -> None:
     """The config entry should unload to unavailable and recover on reload."""
     hass.states.async_set(